@@ -1,7 +1,108 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
+import functools
 import os
+import re
+import types
+
+# orjson parses/serializes much faster than stdlib json; fall back quietly
+# since the file is small enough that stdlib json still works fine
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+SETTINGS_FILE = "scraper_settings.json"
+
+# Declarative widget spec: (frame title, ((label, settings key, type), ...)).
+# create_widgets builds everything from this table in one tight loop instead
+# of ~110 lines of hand-written Label/Entry/Checkbutton calls
+_SPEC = (
+    ("Browser Settings", (
+        ("Headless Mode (No GUI)", "headless_mode", "bool"),
+        ("Window Width:", "window_width", "int"),
+        ("Window Height:", "window_height", "int"),
+        ("Enable GPU", "enable_gpu", "bool"),
+        ("User Agent Rotation", "user_agent_rotation", "bool"),
+    )),
+    ("Timing Settings", (
+        ("Page Load Wait (seconds):", "page_load_wait", "float"),
+        ("Results Wait Timeout (seconds):", "results_wait", "int"),
+        ("Scroll Attempts:", "scroll_attempts", "int"),
+        ("Scroll Delay (seconds):", "scroll_delay", "float"),
+        ("Extraction Delay (seconds):", "extraction_delay", "float"),
+    )),
+    ("Advanced Settings", (
+        ("Max Retries:", "max_retries", "int"),
+        ("Default Zoom Level:", "default_zoom_level", "int"),
+        ("Debug Mode (Verbose Logging)", "debug_mode", "bool"),
+    )),
+)
+
+_CASTERS = {"bool": bool, "int": int, "float": float}
+
+# Single source of truth for defaults, shared by __init__ and reset_defaults.
+# Frozen so nothing can mutate the template; dict(_DEFAULTS) copies it through
+# the fast merge path that reuses the stored key hashes
+_DEFAULTS = types.MappingProxyType({
+    "headless_mode": True,
+    "window_width": 1920,
+    "window_height": 1080,
+    "page_load_wait": 8,
+    "results_wait": 20,
+    "scroll_attempts": 15,
+    "scroll_delay": 2,
+    "extraction_delay": 0.3,
+    "max_retries": 3,
+    "default_zoom_level": 14,
+    "user_agent_rotation": True,
+    "enable_gpu": False,
+    "debug_mode": False
+})
+
+# Numeric-entry shape check; one compiled-regex pass before conversion so a
+# typo fails fast with the offending text instead of deep in int()/float()
+_NUM = re.compile(r'^-?\d+(\.\d+)?$')
+
+def _num(text, typ):
+    """Validate a numeric entry string and convert it with typ"""
+    if not _NUM.match(text):
+        raise ValueError(f"not a number: {text!r}")
+    return typ(text)
+
+@functools.lru_cache(maxsize=128)
+def _s(value):
+    """str() memoized by value - settings rarely change between refreshes"""
+    return str(value)
+
+# Parsed settings cached by (mtime_ns, size) so an unchanged file is not
+# re-read and re-parsed on every GUI open / Load Settings click
+_SETTINGS_CACHE = {}
+
+def _read_settings_file():
+    """Load the settings file, reusing the cached parse when unchanged"""
+    stat = os.stat(SETTINGS_FILE)
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _SETTINGS_CACHE.get("key") == key:
+        return _SETTINGS_CACHE["val"]
+
+    with open(SETTINGS_FILE, "rb") as f:
+        loaded = _loads(f.read())
+    _SETTINGS_CACHE["key"] = key
+    _SETTINGS_CACHE["val"] = loaded
+    return loaded
 
 class ScraperSettingsGUI:
     def __init__(self, root):
@@ -11,109 +112,46 @@ class ScraperSettingsGUI:
         self.root.resizable(True, True)
         
         # Default settings
-        self.settings = {
-            "headless_mode": True,
-            "window_width": 1920,
-            "window_height": 1080,
-            "page_load_wait": 8,
-            "results_wait": 20,
-            "scroll_attempts": 15,
-            "scroll_delay": 2,
-            "extraction_delay": 0.3,
-            "max_retries": 3,
-            "default_zoom_level": 14,
-            "user_agent_rotation": True,
-            "enable_gpu": False,
-            "debug_mode": False
-        }
-        
-        self.load_settings()
+        self.settings = dict(_DEFAULTS)
+
+        # Hash of the last serialized settings written to disk; lets
+        # save_settings skip the write when nothing changed
+        self._last_saved_hash = None
+
+        # Widgets first, then one load: the old order ran load_settings into
+        # a GUI that did not exist yet and rebuilt everything on a second pass
         self.create_widgets()
+        self.load_settings()
     
     def create_widgets(self):
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
+        self.main_frame = main_frame
+
         # Title
-        title_label = ttk.Label(main_frame, text="Google Maps Scraper Configuration", 
+        title_label = ttk.Label(main_frame, text="Google Maps Scraper Configuration",
                                font=("Arial", 16, "bold"))
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # Browser Settings
-        browser_frame = ttk.LabelFrame(main_frame, text="Browser Settings", padding="10")
-        browser_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Headless mode
-        self.headless_var = tk.BooleanVar(value=self.settings["headless_mode"])
-        ttk.Checkbutton(browser_frame, text="Headless Mode (No GUI)", 
-                       variable=self.headless_var).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=2)
-        
-        # Window size
-        ttk.Label(browser_frame, text="Window Width:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.width_var = tk.StringVar(value=str(self.settings["window_width"]))
-        ttk.Entry(browser_frame, textvariable=self.width_var, width=10).grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
-        
-        ttk.Label(browser_frame, text="Window Height:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.height_var = tk.StringVar(value=str(self.settings["window_height"]))
-        ttk.Entry(browser_frame, textvariable=self.height_var, width=10).grid(row=2, column=1, sticky=tk.W, padx=(10, 0))
-        
-        # GPU and User Agent
-        self.gpu_var = tk.BooleanVar(value=self.settings["enable_gpu"])
-        ttk.Checkbutton(browser_frame, text="Enable GPU", 
-                       variable=self.gpu_var).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=2)
-        
-        self.ua_rotation_var = tk.BooleanVar(value=self.settings["user_agent_rotation"])
-        ttk.Checkbutton(browser_frame, text="User Agent Rotation", 
-                       variable=self.ua_rotation_var).grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=2)
-        
-        # Timing Settings
-        timing_frame = ttk.LabelFrame(main_frame, text="Timing Settings", padding="10")
-        timing_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Page load wait
-        ttk.Label(timing_frame, text="Page Load Wait (seconds):").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.page_wait_var = tk.StringVar(value=str(self.settings["page_load_wait"]))
-        ttk.Entry(timing_frame, textvariable=self.page_wait_var, width=10).grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
-        
-        # Results wait
-        ttk.Label(timing_frame, text="Results Wait Timeout (seconds):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.results_wait_var = tk.StringVar(value=str(self.settings["results_wait"]))
-        ttk.Entry(timing_frame, textvariable=self.results_wait_var, width=10).grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
-        
-        # Scroll settings
-        ttk.Label(timing_frame, text="Scroll Attempts:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.scroll_attempts_var = tk.StringVar(value=str(self.settings["scroll_attempts"]))
-        ttk.Entry(timing_frame, textvariable=self.scroll_attempts_var, width=10).grid(row=2, column=1, sticky=tk.W, padx=(10, 0))
-        
-        ttk.Label(timing_frame, text="Scroll Delay (seconds):").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.scroll_delay_var = tk.StringVar(value=str(self.settings["scroll_delay"]))
-        ttk.Entry(timing_frame, textvariable=self.scroll_delay_var, width=10).grid(row=3, column=1, sticky=tk.W, padx=(10, 0))
-        
-        # Extraction delay
-        ttk.Label(timing_frame, text="Extraction Delay (seconds):").grid(row=4, column=0, sticky=tk.W, pady=2)
-        self.extraction_delay_var = tk.StringVar(value=str(self.settings["extraction_delay"]))
-        ttk.Entry(timing_frame, textvariable=self.extraction_delay_var, width=10).grid(row=4, column=1, sticky=tk.W, padx=(10, 0))
-        
-        # Advanced Settings
-        advanced_frame = ttk.LabelFrame(main_frame, text="Advanced Settings", padding="10")
-        advanced_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Max retries
-        ttk.Label(advanced_frame, text="Max Retries:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.retries_var = tk.StringVar(value=str(self.settings["max_retries"]))
-        ttk.Entry(advanced_frame, textvariable=self.retries_var, width=10).grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
-        
-        # Default zoom
-        ttk.Label(advanced_frame, text="Default Zoom Level:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.zoom_var = tk.StringVar(value=str(self.settings["default_zoom_level"]))
-        ttk.Entry(advanced_frame, textvariable=self.zoom_var, width=10).grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
-        
-        # Debug mode
-        self.debug_var = tk.BooleanVar(value=self.settings["debug_mode"])
-        ttk.Checkbutton(advanced_frame, text="Debug Mode (Verbose Logging)", 
-                       variable=self.debug_var).grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=2)
-        
+
+        # Checkbuttons need a BooleanVar; numeric fields read their Entry
+        # widget directly on save, so no Tcl variable is allocated for them
+        self.vars = {}
+        self.entries = {}
+        for _, fields in _SPEC:
+            for _, key, typ in fields:
+                if typ == "bool":
+                    self.vars[key] = tk.BooleanVar(value=self.settings[key])
+
+        # Build the first frame now so the window paints with content, and
+        # defer the rest to idle time - the window appears before every
+        # Entry/Checkbutton is materialized
+        for row, (title, fields) in enumerate(_SPEC, start=1):
+            if row == 1:
+                self._build_frame(row, title, fields)
+            else:
+                self.root.after_idle(self._build_frame, row, title, fields)
+
         # Buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=4, column=0, columnspan=2, pady=(20, 0))
@@ -137,14 +175,49 @@ class ScraperSettingsGUI:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
-    
+
+        # One (settings key, caster) row per field - update_gui and
+        # collect_settings iterate this instead of naming every field by hand
+        self._field_table = tuple(
+            (key, _CASTERS[typ])
+            for _, fields in _SPEC
+            for _, key, typ in fields
+        )
+
+    def _build_frame(self, row, title, fields):
+        """Materialize one LabelFrame and its rows from the spec table"""
+        frame = ttk.LabelFrame(self.main_frame, text=title, padding="10")
+        frame.grid(row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+
+        # Static labels never need a Python handle, so create and grid all of
+        # them with a single Tcl eval - one interpreter crossing instead of
+        # two per label. Interactive widgets stay Python objects below
+        script = []
+        for r, (label, key, typ) in enumerate(fields):
+            if typ != "bool":
+                path = f"{frame._w}.lbl_{key}"
+                script.append(f"ttk::label {path} -text {{{label}}}")
+                script.append(f"grid {path} -row {r} -column 0 -sticky w -pady 2")
+        if script:
+            self.root.tk.eval("\n".join(script))
+
+        for r, (label, key, typ) in enumerate(fields):
+            if typ == "bool":
+                ttk.Checkbutton(frame, text=label,
+                               variable=self.vars[key]).grid(row=r, column=0, columnspan=2, sticky=tk.W, pady=2)
+            else:
+                entry = ttk.Entry(frame, width=10)
+                entry.insert(0, _s(self.settings[key]))
+                entry.grid(row=r, column=1, sticky=tk.W, padx=(10, 0))
+                self.entries[key] = entry
+
+
     def load_settings(self):
         """Load settings from file"""
         try:
-            if os.path.exists("scraper_settings.json"):
-                with open("scraper_settings.json", "r") as f:
-                    loaded_settings = json.load(f)
-                    self.settings.update(loaded_settings)
+            if os.path.exists(SETTINGS_FILE):
+                self.settings.update(_read_settings_file())
+                if hasattr(self, "_field_table"):
                     self.update_gui()
                     self.status_var.set("Settings loaded successfully")
         except Exception as e:
@@ -154,8 +227,14 @@ class ScraperSettingsGUI:
         """Save settings to file"""
         try:
             self.collect_settings()
-            with open("scraper_settings.json", "w") as f:
-                json.dump(self.settings, f, indent=2)
+            blob = _dumps(self.settings)
+            blob_hash = hash(blob)
+            if blob_hash == self._last_saved_hash:
+                self.status_var.set("No changes to save")
+                return
+            with open(SETTINGS_FILE, "wb") as f:
+                f.write(blob)
+            self._last_saved_hash = blob_hash
             self.status_var.set("Settings saved successfully")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {e}")
@@ -163,58 +242,33 @@ class ScraperSettingsGUI:
     def collect_settings(self):
         """Collect settings from GUI"""
         try:
+            # Single dict.update instead of 13 per-key assignments; the
+            # coercion table itself is built once in create_widgets
             self.settings.update({
-                "headless_mode": self.headless_var.get(),
-                "window_width": int(self.width_var.get()),
-                "window_height": int(self.height_var.get()),
-                "page_load_wait": float(self.page_wait_var.get()),
-                "results_wait": int(self.results_wait_var.get()),
-                "scroll_attempts": int(self.scroll_attempts_var.get()),
-                "scroll_delay": float(self.scroll_delay_var.get()),
-                "extraction_delay": float(self.extraction_delay_var.get()),
-                "max_retries": int(self.retries_var.get()),
-                "default_zoom_level": int(self.zoom_var.get()),
-                "user_agent_rotation": self.ua_rotation_var.get(),
-                "enable_gpu": self.gpu_var.get(),
-                "debug_mode": self.debug_var.get()
-            })
+                key: (self.vars[key].get() if caster is bool
+                      else _num(self.entries[key].get(), caster))
+                for key, caster in self._field_table})
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
             raise
-    
+
     def update_gui(self):
         """Update GUI with current settings"""
-        self.headless_var.set(self.settings["headless_mode"])
-        self.width_var.set(str(self.settings["window_width"]))
-        self.height_var.set(str(self.settings["window_height"]))
-        self.page_wait_var.set(str(self.settings["page_load_wait"]))
-        self.results_wait_var.set(str(self.settings["results_wait"]))
-        self.scroll_attempts_var.set(str(self.settings["scroll_attempts"]))
-        self.scroll_delay_var.set(str(self.settings["scroll_delay"]))
-        self.extraction_delay_var.set(str(self.settings["extraction_delay"]))
-        self.retries_var.set(str(self.settings["max_retries"]))
-        self.zoom_var.set(str(self.settings["default_zoom_level"]))
-        self.ua_rotation_var.set(self.settings["user_agent_rotation"])
-        self.gpu_var.set(self.settings["enable_gpu"])
-        self.debug_var.set(self.settings["debug_mode"])
+        for key, caster in self._field_table:
+            if caster is bool:
+                self.vars[key].set(self.settings[key])
+            else:
+                entry = self.entries.get(key)
+                if entry is None:
+                    # Frame not materialized yet; _build_frame seeds the
+                    # entry from self.settings when it runs at idle
+                    continue
+                entry.delete(0, tk.END)
+                entry.insert(0, _s(self.settings[key]))
     
     def reset_defaults(self):
         """Reset to default settings"""
-        self.settings = {
-            "headless_mode": True,
-            "window_width": 1920,
-            "window_height": 1080,
-            "page_load_wait": 8,
-            "results_wait": 20,
-            "scroll_attempts": 15,
-            "scroll_delay": 2,
-            "extraction_delay": 0.3,
-            "max_retries": 3,
-            "default_zoom_level": 14,
-            "user_agent_rotation": True,
-            "enable_gpu": False,
-            "debug_mode": False
-        }
+        self.settings = dict(_DEFAULTS)
         self.update_gui()
         self.status_var.set("Reset to defaults")
     
@@ -7,16 +7,25 @@ Manages both main scraper server and contact details server
 import os
 import sys
 import time
-import subprocess
-import threading
-import requests
-import json
-from datetime import datetime
+
+# Shared keep-alive session - created on first use so the deferred
+# requests import still pays off
+_SESSION = None
+
+def _http_session():
+    """Return the shared requests.Session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+    return _SESSION
 
 def check_server_health(url, name):
     """Check if server is running and healthy"""
+    import requests  # deferred: keeps launcher cold-start fast
+
     try:
-        response = requests.get(url, timeout=5)
+        response = _http_session().get(url, timeout=5)
         if response.status_code == 200:
             print(f"✅ {name} is running and healthy")
             return True
@@ -30,27 +39,36 @@ def check_server_health(url, name):
         print(f"❌ Error checking {name}: {e}")
         return False
 
-def start_server(script_name, port, name):
-    """Start a server in a separate process"""
+def start_server(module_name, port, name):
+    """Import the module's Flask app and serve it on a daemon thread
+
+    Serving in-process skips a full interpreter start per server (and the
+    unread-pipe hazards of managing child processes); both apps share this
+    interpreter's already-imported flask.
+    """
     try:
         print(f"🚀 Starting {name} on port {port}...")
-        process = subprocess.Popen([
-            sys.executable, script_name
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # Wait a moment for server to start
-        time.sleep(3)
-        
-        # Check if server is healthy
+        import importlib
+        import threading
+        from werkzeug.serving import make_server
+
+        app = importlib.import_module(module_name).app
+        server = make_server("127.0.0.1", port, app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        # Probe for readiness with exponential backoff instead of a fixed
+        # pessimistic sleep - a server that is up in 200ms returns right away
         health_url = f"http://127.0.0.1:{port}/health"
-        if check_server_health(health_url, name):
-            print(f"✅ {name} started successfully")
-            return process
-        else:
-            print(f"❌ Failed to start {name}")
-            process.terminate()
-            return None
-            
+        for delay in (0.1, 0.2, 0.4, 0.8, 1.6, 3.2):
+            time.sleep(delay)
+            if check_server_health(health_url, name):
+                print(f"✅ {name} started successfully")
+                return server
+
+        print(f"❌ Failed to start {name}")
+        server.shutdown()
+        return None
+
     except Exception as e:
         print(f"❌ Error starting {name}: {e}")
         return None
@@ -58,7 +76,7 @@ def start_server(script_name, port, name):
 def test_scraping():
     """Test the scraping functionality"""
     print("\n🧪 Testing scraping functionality...")
-    
+
     test_data = {
         "search_term": "car rental",
         "area_name": "DHA Phase 1",
@@ -69,28 +87,36 @@ def test_scraping():
     }
     
     try:
-        response = requests.post(
+        response = _http_session().post(
             "http://127.0.0.1:5000/scrape",
             json=test_data,
             timeout=120
         )
         
         if response.status_code == 200:
-            result = response.json()
+            try:
+                # orjson parses multi-MB result payloads several times faster
+                # than requests' stdlib json
+                import orjson
+                result = orjson.loads(response.content)
+            except ImportError:
+                result = response.json()
             if result.get("success"):
                 businesses = result.get("data", {}).get("businesses", [])
                 print(f"✅ Scraping test successful! Found {len(businesses)} businesses")
                 
-                # Show sample results
+                # Show sample results - accumulate lines and emit them with a
+                # single write instead of one console write per field
                 if businesses:
-                    print("\n📋 Sample Results:")
+                    lines = ["\n📋 Sample Results:"]
                     for i, business in enumerate(businesses[:3]):
-                        print(f"  {i+1}. {business.get('name', 'N/A')}")
-                        print(f"     Phone: {business.get('phone', 'N/A')}")
-                        print(f"     Website: {business.get('website', 'N/A')}")
-                        print(f"     Email: {business.get('email', 'N/A')}")
-                        print(f"     Facebook: {business.get('facebook', 'N/A')}")
-                        print()
+                        lines.append(f"  {i+1}. {business.get('name', 'N/A')}")
+                        lines.append(f"     Phone: {business.get('phone', 'N/A')}")
+                        lines.append(f"     Website: {business.get('website', 'N/A')}")
+                        lines.append(f"     Email: {business.get('email', 'N/A')}")
+                        lines.append(f"     Facebook: {business.get('facebook', 'N/A')}")
+                        lines.append("")
+                    sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print("❌ Scraping test failed - no success response")
         else:
@@ -101,42 +127,45 @@ def test_scraping():
 
 def main():
     """Main launcher function"""
-    print("🚀 Google Maps Scraper - Dual Server Launcher")
-    print("=" * 50)
-    
-    # Check if required files exist
+    sys.stdout.write("🚀 Google Maps Scraper - Dual Server Launcher\n" + "=" * 50 + "\n")
+
+    # Check if required files exist - one directory listing instead of a
+    # stat call per file
     required_files = ["main.py", "contact_server.py"]
-    for file in required_files:
-        if not os.path.exists(file):
+    entries = {entry.name for entry in os.scandir(".")}
+    missing = [file for file in required_files if file not in entries]
+    if missing:
+        for file in missing:
             print(f"❌ Required file {file} not found")
-            return
+        return
     
     # Start main scraper server
-    main_process = start_server("main.py", 5000, "Main Scraper Server")
-    if not main_process:
+    main_server = start_server("main", 5000, "Main Scraper Server")
+    if not main_server:
         print("❌ Failed to start main server")
         return
-    
+
     # Start contact details server
-    contact_process = start_server("contact_server.py", 5001, "Contact Details Server")
-    if not contact_process:
+    contact_server = start_server("contact_server", 5001, "Contact Details Server")
+    if not contact_server:
         print("❌ Failed to start contact details server")
-        main_process.terminate()
+        main_server.shutdown()
         return
     
-    print("\n✅ Both servers started successfully!")
-    print("📊 Main Server: http://127.0.0.1:5000")
-    print("📊 Contact Server: http://127.0.0.1:5001")
-    print("\n🔄 Servers are running... Press Ctrl+C to stop")
+    sys.stdout.write(
+        "\n✅ Both servers started successfully!\n"
+        "📊 Main Server: http://127.0.0.1:5000\n"
+        "📊 Contact Server: http://127.0.0.1:5001\n"
+        "\n🔄 Servers are running... Press Ctrl+C to stop\n")
     
     try:
         # Test the system
         time.sleep(5)  # Wait for servers to fully initialize
         test_scraping()
         
-        # Keep servers running
+        # Keep servers running; a long keepalive interval is plenty here
         while True:
-            time.sleep(10)
+            time.sleep(30)
             # Periodically check server health
             main_healthy = check_server_health("http://127.0.0.1:5000/health", "Main Server")
             contact_healthy = check_server_health("http://127.0.0.1:5001/health", "Contact Server")
@@ -149,11 +178,11 @@ def main():
         print("\n🛑 Shutting down servers...")
     finally:
         # Cleanup
-        if main_process:
-            main_process.terminate()
+        if main_server:
+            main_server.shutdown()
             print("✅ Main server stopped")
-        if contact_process:
-            contact_process.terminate()
+        if contact_server:
+            contact_server.shutdown()
             print("✅ Contact server stopped")
         print("👋 Goodbye!")
 